@@ -2,7 +2,7 @@
 Interior Optimization API Endpoint
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 from shapely.geometry import Polygon
@@ -32,52 +32,51 @@ class OptimizationResponse(BaseModel):
     layout: List[Dict[str, Any]] # [{"id": "bed", "x": 1.2, "y": 3.0, "rotation": 90}, ...]
 
 @router.post("/optimize", response_model=OptimizationResponse)
-async def optimize_interior(request: OptimizationRequest):
-    try:
-        # 1. Convert input to internal format
-        room_poly = Polygon(request.room_polygon)
-        
-        furniture_data = []
-        for item in request.furniture_items:
-            furniture_data.append({
-                "id": item.id,
-                "width": item.width,
-                "depth": item.depth,
-                "height": item.height,
-                "rotatable": item.rotatable,
-                "category": item.category
-            })
-            
-        # 2. Run Genetic Algorithm
-        # Use more generations for better quality, especially in small rooms
-        optimizer = GeneticOptimizer(
-            room_poly, 
-            furniture_data, 
-            population_size=100, 
-            generations=150
-        )
-        
-        best_layout, best_fitness = optimizer.optimize()
-        
-        # Calculate percentage
-        score_pct = optimizer.evaluator.calculate_normalized_score(best_fitness)
+def optimize_interior(request: OptimizationRequest):
+    # Plain def: the GA is CPU-bound, so FastAPI runs it in the threadpool
+    # instead of blocking the event loop
+
+    # 1. Convert input to internal format
+    room_poly = Polygon(request.room_polygon)
+    
+    furniture_data = []
+    for item in request.furniture_items:
+        furniture_data.append({
+            "id": item.id,
+            "width": item.width,
+            "depth": item.depth,
+            "height": item.height,
+            "rotatable": item.rotatable,
+            "category": item.category
+        })
         
-        # 3. Format output
-        formatted_layout = []
-        for i, (x, y, rot) in enumerate(best_layout):
-            item_id = furniture_data[i]["id"]
-            formatted_layout.append({
-                "id": item_id,
-                "x": round(x, 2),
-                "y": round(y, 2),
-                "rotation": rot
-            })
-            
-        return {
-            "fitness": best_fitness,
-            "score_percentage": round(score_pct, 1),
-            "layout": formatted_layout
-        }
+    # 2. Run Genetic Algorithm
+    # Use more generations for better quality, especially in small rooms
+    optimizer = GeneticOptimizer(
+        room_poly, 
+        furniture_data, 
+        population_size=100, 
+        generations=150
+    )
+    
+    best_layout, best_fitness = optimizer.optimize()
+    
+    # Calculate percentage
+    score_pct = optimizer.evaluator.calculate_normalized_score(best_fitness)
+    
+    # 3. Format output
+    formatted_layout = []
+    for i, (x, y, rot) in enumerate(best_layout):
+        item_id = furniture_data[i]["id"]
+        formatted_layout.append({
+            "id": item_id,
+            "x": round(x, 2),
+            "y": round(y, 2),
+            "rotation": rot
+        })
         
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {
+        "fitness": best_fitness,
+        "score_percentage": round(score_pct, 1),
+        "layout": formatted_layout
+    }
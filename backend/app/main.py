@@ -1,11 +1,33 @@
+import json
+import logging
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, Response
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json"
 )
 
+class UnhandledExceptionMiddleware:
+    """Map unexpected errors to a 500 JSON body in one place instead of per-endpoint try/except"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await self.app(scope, receive, send)
+        except Exception as exc:
+            logger.exception("Unhandled error on %s", scope.get("path"))
+            await JSONResponse({"detail": str(exc)}, status_code=500)(scope, receive, send)
+
+# Added before CORSMiddleware so it runs inside it and error responses
+# still carry the CORS headers the frontend needs
+app.add_middleware(UnhandledExceptionMiddleware)
+
 # Set all CORS enabled origins
 from fastapi.middleware.cors import CORSMiddleware
 app.add_middleware(
@@ -16,9 +38,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Health body never changes after startup, so serialize it once
+HEALTH_BODY = json.dumps({"status": "healthy", "project": settings.PROJECT_NAME}, separators=(",", ":")).encode()
+
 @app.get("/health")
 def health_check():
-    return {"status": "healthy", "project": settings.PROJECT_NAME}
+    return Response(HEALTH_BODY, media_type="application/json")
 
 @app.get("/")
 def root():
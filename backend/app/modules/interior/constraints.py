@@ -2,7 +2,9 @@
 Constraint Checking for Interior Optimization
 """
 
-from .geometry import create_furniture_polygon, check_intersection, check_containment, calculate_overlap_area
+import shapely
+import numpy as np
+from .geometry import create_furniture_polygon, check_containment, calculate_overlap_areas, distance_to_wall
 
 class ConstraintChecker:
     def __init__(self, room_poly, doors, windows):
@@ -10,6 +12,23 @@ class ConstraintChecker:
         self.doors = doors
         self.windows = windows
         
+        # Room geometry is queried for every item of every layout: build the
+        # boundary ring once and prepare the room for fast repeated contains()
+        self.room_boundary = room_poly.boundary
+        shapely.prepare(self.room_poly)
+        
+        # Wall segments (exterior + any holes) as (K, 2) arrays for
+        # vectorized point-to-wall distances
+        seg_a, seg_b = [], []
+        for ring in [room_poly.exterior, *room_poly.interiors]:
+            ring_coords = np.asarray(ring.coords, dtype=float)[:, :2]
+            seg_a.append(ring_coords[:-1])
+            seg_b.append(ring_coords[1:])
+        self.seg_a = np.concatenate(seg_a)
+        self.seg_d = np.concatenate(seg_b) - self.seg_a
+        seg_len2 = (self.seg_d * self.seg_d).sum(axis=1)
+        self.seg_len2 = np.where(seg_len2 > 0, seg_len2, 1.0) # Guard zero-length edges
+        
         # Create polygons for doors (clearance zones)
         self.door_polys = []
         for door in doors:
@@ -28,12 +47,10 @@ class ConstraintChecker:
 
     def check_overlap(self, furniture_poly, other_polys):
         """Check if furniture overlaps with any other furniture"""
-        for other in other_polys:
-            if check_intersection(furniture_poly, other):
-                # Allow slight touching? No, strict no-overlap for now
-                if calculate_overlap_area(furniture_poly, other) > 0.01: # Tolerance
-                    return True
-        return False
+        if len(other_polys) == 0:
+            return False
+        # Allow slight touching? No, strict no-overlap for now
+        return bool((calculate_overlap_areas(furniture_poly, other_polys) > 0.01).any()) # Tolerance
 
     def check_door_blocking(self, furniture_poly):
         """Check if furniture blocks a door"""
@@ -60,6 +77,18 @@ class ConstraintChecker:
 
     def get_nearest_wall_distance(self, furniture_poly):
         """Get distance to nearest wall"""
-        from .geometry import distance_to_wall
         # Use centroid for distance
-        return distance_to_wall(furniture_poly.centroid, self.room_poly)
+        return distance_to_wall(furniture_poly.centroid, self.room_poly, self.room_boundary)
+
+    def min_dist_to_walls(self, points):
+        """
+        Distance from each point to the nearest wall, for many points at once.
+        points: (N, 2) array of x, y
+        Returns: (N,) array of distances
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        rel = points[:, None, :] - self.seg_a                       # (N, K, 2)
+        # Projection of each point onto each segment, clamped to the segment
+        t = np.clip((rel * self.seg_d).sum(axis=-1) / self.seg_len2, 0.0, 1.0)
+        closest = self.seg_a + t[..., None] * self.seg_d
+        return np.linalg.norm(points[:, None, :] - closest, axis=-1).min(axis=1)
@@ -3,7 +3,9 @@ Fitness Function for Interior Optimization
 Calculates the score of a given furniture layout.
 """
 
-from .geometry import calculate_overlap_area, check_containment
+import numpy as np
+import shapely
+from .geometry import create_furniture_polygons, check_containment_all, calculate_pairwise_overlap_areas
 from .constraints import ConstraintChecker
 
 class FitnessEvaluator:
@@ -12,6 +14,9 @@ class FitnessEvaluator:
         self.furniture_items = furniture_items
         self.constraints = constraints
         self.room_area = room_poly.area
+        # Item sizes are fixed for the run; only positions change per layout
+        self.widths = np.array([item["width"] for item in furniture_items], dtype=float)
+        self.depths = np.array([item["depth"] for item in furniture_items], dtype=float)
 
     def calculate_fitness(self, layout):
         """
@@ -23,24 +28,20 @@ class FitnessEvaluator:
         
         # 1. Hard Constraints (Penalties)
         penalty = 0.0
-        furniture_polys = []
         
-        # Create polygons for current layout
-        for i, item in enumerate(self.furniture_items):
-            x, y, rot = layout[i]
-            poly = self.constraints.create_furniture_polygon_wrapper(item, x, y, rot) # Helper needed
-            furniture_polys.append(poly)
+        # Create polygons for current layout (all rectangles in one call)
+        positions = np.asarray(layout, dtype=float).reshape(-1, 3)
+        furniture_polys = create_furniture_polygons(
+            positions[:, 0], positions[:, 1], self.widths, self.depths, positions[:, 2]
+        )
             
-            # Boundary check
-            if not self.constraints.check_boundary(poly):
-                penalty += 1000 # Heavy penalty for being outside
+        # Boundary check (one vectorized GEOS call for all items)
+        inside = check_containment_all(self.room_poly, furniture_polys)
+        penalty += 1000 * int((~inside).sum()) # Heavy penalty for being outside
             
-        # Overlap check
-        for i in range(len(furniture_polys)):
-            for j in range(i + 1, len(furniture_polys)):
-                overlap = calculate_overlap_area(furniture_polys[i], furniture_polys[j])
-                if overlap > 0:
-                    penalty += overlap * 500 # Penalty proportional to overlap area
+        # Overlap check (all pairs at once)
+        overlaps = calculate_pairwise_overlap_areas(furniture_polys)
+        penalty += float(overlaps.sum()) * 500 # Penalty proportional to overlap area
                     
         # If hard constraints violated, return low score
         if penalty > 0:
@@ -51,12 +52,10 @@ class FitnessEvaluator:
         # For now, let's reward keeping center open (distance from center?)
         # Or alignment with walls
         
-        alignment_score = 0
-        for poly in furniture_polys:
-            # Check distance to nearest wall
-            dist = self.constraints.get_nearest_wall_distance(poly)
-            if dist < 0.1: # Close to wall
-                alignment_score += 10
+        # Check distance from each centroid to nearest wall (all items at once)
+        centroids = shapely.get_coordinates(shapely.centroid(furniture_polys))
+        dists = self.constraints.min_dist_to_walls(centroids)
+        alignment_score = 10 * int((dists < 0.1).sum()) # Close to wall
                 
         score += alignment_score
         
@@ -3,8 +3,9 @@ Geometry Utilities for Interior Optimization
 Uses Shapely for robust geometric operations.
 """
 
+import shapely
+import numpy as np
 from shapely.geometry import Polygon, Point, LineString
-from shapely.affinity import rotate, translate
 import math
 
 def create_furniture_polygon(x, y, width, depth, angle):
@@ -14,24 +15,33 @@ def create_furniture_polygon(x, y, width, depth, angle):
     width, depth: Dimensions
     angle: Rotation in degrees
     """
-    # Create rectangle centered at (0,0)
-    half_w = width / 2
-    half_d = depth / 2
-    coords = [
-        (-half_w, -half_d),
-        (half_w, -half_d),
-        (half_w, half_d),
-        (-half_w, half_d)
-    ]
-    poly = Polygon(coords)
+    return create_furniture_polygons([x], [y], [width], [depth], [angle])[0]
+
+def create_furniture_polygons(xs, ys, widths, depths, angles):
+    """
+    Vectorized create_furniture_polygon: build N furniture rectangles at once.
+    Corners are rotated/translated analytically with numpy and handed to GEOS
+    in a single shapely.polygons call (no per-item rotate/translate).
+    """
+    # Rectangle corners centered at (0,0), shape (N, 4)
+    half_w = np.asarray(widths, dtype=float)[:, None] / 2
+    half_d = np.asarray(depths, dtype=float)[:, None] / 2
+    corner_x = np.hstack([-half_w, half_w, half_w, -half_w])
+    corner_y = np.hstack([-half_d, -half_d, half_d, half_d])
     
-    # Rotate
-    if angle != 0:
-        poly = rotate(poly, angle, origin=(0, 0))
+    # Rotate (counter-clockwise about the center, like shapely.affinity.rotate)
+    rad = np.radians(np.asarray(angles, dtype=float))[:, None]
+    cos_a = np.cos(rad)
+    sin_a = np.sin(rad)
+    # Snap float noise so 90/180/270 give exact axis-aligned rectangles
+    cos_a[np.abs(cos_a) < 2.5e-16] = 0.0
+    sin_a[np.abs(sin_a) < 2.5e-16] = 0.0
     
     # Translate to position
-    poly = translate(poly, x, y)
-    return poly
+    coords = np.empty(corner_x.shape + (2,))
+    coords[..., 0] = corner_x * cos_a - corner_y * sin_a + np.asarray(xs, dtype=float)[:, None]
+    coords[..., 1] = corner_x * sin_a + corner_y * cos_a + np.asarray(ys, dtype=float)[:, None]
+    return shapely.polygons(coords)
 
 def create_room_polygon(coords):
     """Create a shapely Polygon for the room from a list of [x, y] points"""
@@ -51,10 +61,39 @@ def calculate_overlap_area(poly1, poly2):
         return 0.0
     return poly1.intersection(poly2).area
 
-def distance_to_wall(point, room_poly):
-    """Calculate minimum distance from a point to the room boundary"""
+def check_containment_all(container, items):
+    """Vectorized containment: boolean array, True where item is inside container"""
+    return shapely.contains(container, np.asarray(items, dtype=object))
+
+def calculate_overlap_areas(poly, others):
+    """Vectorized intersection area of poly with each polygon in others"""
+    others = np.asarray(others, dtype=object)
+    areas = np.zeros(len(others))
+    # Only build intersection geometries for pairs that actually touch
+    hits = shapely.intersects(poly, others)
+    if hits.any():
+        areas[hits] = shapely.area(shapely.intersection(poly, others[hits]))
+    return areas
+
+def calculate_pairwise_overlap_areas(polys):
+    """Intersection area for every unordered pair (i < j) of polygons"""
+    polys = np.asarray(polys, dtype=object)
+    i, j = np.triu_indices(len(polys), k=1)
+    areas = np.zeros(len(i))
+    hits = shapely.intersects(polys[i], polys[j])
+    if hits.any():
+        areas[hits] = shapely.area(shapely.intersection(polys[i[hits]], polys[j[hits]]))
+    return areas
+
+def distance_to_wall(point, room_poly, boundary=None):
+    """
+    Calculate minimum distance from a point to the room boundary.
+    boundary: Optional precomputed room_poly.boundary to avoid rebuilding it
+    """
+    if boundary is None:
+        boundary = room_poly.boundary
     p = Point(point)
-    return room_poly.boundary.distance(p)
+    return boundary.distance(p)
 
 def get_nearest_wall_edge(poly, room_poly):
     """Find which wall of the room is closest to the furniture"""
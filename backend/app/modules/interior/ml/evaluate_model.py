@@ -8,7 +8,6 @@ import numpy as np
 from pathlib import Path
 import sys
 import os
-import random
 
 # Add paths
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../../")))
@@ -57,15 +56,16 @@ def evaluate_model():
     print(f"Model Loaded: {model_path}")
     
     # Prepare Test Features (simplified, matching training)
-    y_true = []
-    y_pred = []
+    # Preallocated so the whole set is scored in one forward pass
+    features = np.empty((len(val_data), 7), dtype=np.float32)
+    y_true = np.empty(len(val_data))
     
     # Imports for fitness calculation
     from backend.app.modules.interior.fitness import FitnessEvaluator
     from backend.app.modules.interior.constraints import ConstraintChecker
     from backend.app.modules.interior.geometry import create_room_polygon
     
-    for scenario in val_data:
+    for row, scenario in enumerate(val_data):
         # Extract features (same as training)
         room_area = scenario["room_area"] / 50.0
         aspect_ratio = scenario["room_aspect_ratio"] / 2.0
@@ -93,17 +93,17 @@ def evaluate_model():
         # This matches train.py logic.
         
         min_x, min_y, max_x, max_y = room_poly.bounds
-        current_layout_items = []
+        num_items = len(furniture_items)
+        rotatable = np.array([item["rotatable"] for item in furniture_items], dtype=bool)
         
-        for item in furniture_items:
-            x = random.uniform(min_x, max_x)
-            y = random.uniform(min_y, max_y)
-            rotation = random.choice([0, 90, 180, 270]) if item["rotatable"] else 0
-            
-            placed_item = item.copy()
-            placed_item["position"] = {"x": x, "y": y}
-            placed_item["rotation"] = rotation
-            current_layout_items.append(placed_item)
+        xs = np.random.uniform(min_x, max_x, num_items)
+        ys = np.random.uniform(min_y, max_y, num_items)
+        rotations = np.where(rotatable, np.random.choice([0, 90, 180, 270], num_items), 0)
+        
+        current_layout_items = [
+            dict(item, position={"x": x, "y": y}, rotation=rotation)
+            for item, x, y, rotation in zip(furniture_items, xs.tolist(), ys.tolist(), rotations.tolist())
+        ]
             
         # 1. Calculate Ground Truth
         try:
@@ -115,26 +115,21 @@ def evaluate_model():
         
         # 2. Prepare Model Input
         # Calculate layout features
-        avg_x = sum(i["position"]["x"] for i in current_layout_items) / len(current_layout_items)
-        avg_y = sum(i["position"]["y"] for i in current_layout_items) / len(current_layout_items)
+        avg_x = xs.mean()
+        avg_y = ys.mean()
         
         width = max_x - min_x
         height = max_y - min_y
         norm_avg_x = avg_x / width if width > 0 else 0
         norm_avg_y = avg_y / height if height > 0 else 0
         
-        features = torch.tensor([room_area, aspect_ratio, num_doors, num_windows, 
-                                  num_furniture, norm_avg_x, norm_avg_y], dtype=torch.float32)
-        
-        # 3. Model Prediction
-        with torch.no_grad():
-            pred_score = model(features.unsqueeze(0)).item()
-        
-        y_true.append(true_score)
-        y_pred.append(pred_score)
+        features[row] = [room_area, aspect_ratio, num_doors, num_windows, 
+                         num_furniture, norm_avg_x, norm_avg_y]
+        y_true[row] = true_score
     
-    y_true = np.array(y_true)
-    y_pred = np.array(y_pred)
+    # 3. Model Prediction (single batched forward pass)
+    with torch.no_grad():
+        y_pred = model(torch.from_numpy(features)).squeeze(1).numpy().astype(np.float64)
     
     # Calculate Metrics
     mse = np.mean((y_true - y_pred) ** 2)
@@ -1,7 +1,6 @@
 import json
 import os
 import sys
-import random
 import torch
 import torch.nn as nn
 import torch.optim as optim
@@ -29,13 +28,16 @@ class InteriorDataset(Dataset):
             self.scenarios = json.load(f)
             
         self.samples_per_room = samples_per_room
-        self.data = []
-        self.labels = []
+        # Preallocated feature/label matrices, filled row by row
+        num_samples = len(self.scenarios) * samples_per_room
+        self.data = np.empty((num_samples, 7), dtype=np.float32)
+        self.labels = np.empty(num_samples, dtype=np.float32)
         
         print(f"Generating training samples from {len(self.scenarios)} scenarios...")
         self._generate_samples()
         
     def _generate_samples(self):
+        row = 0
         for scenario in self.scenarios:
             # Extract static room features (normalized roughly)
             room_area = scenario["room_area"] / 50.0 # Normalize by max expected area
@@ -58,6 +60,9 @@ class InteriorDataset(Dataset):
             constraints = ConstraintChecker(room_poly, doors, windows)
             evaluator = FitnessEvaluator(room_poly, furniture_items, constraints)
             
+            num_items = len(furniture_items)
+            rotatable = np.array([item["rotatable"] for item in furniture_items], dtype=bool)
+            
             for _ in range(self.samples_per_room):
                 # Randomize positions
                 placed_items = []
@@ -72,19 +77,16 @@ class InteriorDataset(Dataset):
                 # This is a simplified simulation
                 min_x, min_y, max_x, max_y = room_poly.bounds
                 
-                current_layout_items = []
+                # Random x, y, rotation for all items at once
+                xs = np.random.uniform(min_x, max_x, num_items)
+                ys = np.random.uniform(min_y, max_y, num_items)
+                rotations = np.where(rotatable, np.random.choice([0, 90, 180, 270], num_items), 0)
                 
-                for item in furniture_items:
-                    # Random x, y, rotation
-                    x = random.uniform(min_x, max_x)
-                    y = random.uniform(min_y, max_y)
-                    rotation = random.choice([0, 90, 180, 270]) if item["rotatable"] else 0
-                    
-                    # Create item with position
-                    placed_item = item.copy()
-                    placed_item["position"] = {"x": x, "y": y}
-                    placed_item["rotation"] = rotation
-                    current_layout_items.append(placed_item)
+                # Create items with position
+                current_layout_items = [
+                    dict(item, position={"x": x, "y": y}, rotation=rotation)
+                    for item, x, y, rotation in zip(furniture_items, xs.tolist(), ys.tolist(), rotations.tolist())
+                ]
                 
                 # Calculate Fitness
                 try:
@@ -104,8 +106,8 @@ class InteriorDataset(Dataset):
                 
                 # Simplified Feature Vector: 
                 # [RoomArea, AspectRatio, NumDoors, NumWindows, NumFurniture, AvgX, AvgY, SpreadX, SpreadY]
-                avg_x = sum(i["position"]["x"] for i in current_layout_items) / len(current_layout_items)
-                avg_y = sum(i["position"]["y"] for i in current_layout_items) / len(current_layout_items)
+                avg_x = xs.mean()
+                avg_y = ys.mean()
                 
                 # Normalize positions by room dims
                 width = max_x - min_x
@@ -113,16 +115,21 @@ class InteriorDataset(Dataset):
                 norm_avg_x = avg_x / width if width > 0 else 0
                 norm_avg_y = avg_y / height if height > 0 else 0
                 
-                features = base_features + [norm_avg_x, norm_avg_y]
+                self.data[row, :5] = base_features
+                self.data[row, 5] = norm_avg_x
+                self.data[row, 6] = norm_avg_y
+                self.labels[row] = normalized_score
+                row += 1
                 
-                self.data.append(features)
-                self.labels.append(normalized_score)
+        # Convert once so __getitem__ just indexes (no per-sample tensor builds)
+        self.data = torch.from_numpy(self.data)
+        self.labels = torch.from_numpy(self.labels)
 
     def __len__(self):
         return len(self.data)
 
     def __getitem__(self, idx):
-        return torch.tensor(self.data[idx], dtype=torch.float32), torch.tensor(self.labels[idx], dtype=torch.float32)
+        return self.data[idx], self.labels[idx]
 
 def train_model():
     print("="*50)
@@ -4,6 +4,7 @@ Genetic Algorithm Optimizer for Interior Design
 
 import random
 import copy
+import threading
 import torch
 import os
 import numpy as np
@@ -12,6 +13,27 @@ from .constraints import ConstraintChecker
 from .fitness import FitnessEvaluator
 from .ml.model import InteriorFitnessModel
 
+MODEL_PATH = os.path.join(os.path.dirname(__file__), "ml/models/best_model.pth")
+
+# The surrogate model is read-only at inference time, so every optimizer
+# in the process shares one loaded copy instead of re-reading the weights
+_MODEL_CACHE = {}
+_MODEL_LOCK = threading.Lock()
+
+def _load_ml_model(model_path, device):
+    """Load the surrogate fitness model once per process and device"""
+    key = (model_path, str(device))
+    with _MODEL_LOCK:
+        model = _MODEL_CACHE.get(key)
+        if model is None:
+            # Calculate input size: 5 base features + 2 layout features (avg_x, avg_y)
+            input_size = 7
+            model = InteriorFitnessModel(input_size=input_size)
+            model.load_state_dict(torch.load(model_path, map_location=device))
+            model.to(device).eval()
+            _MODEL_CACHE[key] = model
+        return model
+
 class GeneticOptimizer:
     def __init__(self, room_poly, furniture_items, population_size=50, generations=100):
         self.room_poly = room_poly
@@ -28,19 +50,26 @@ class GeneticOptimizer:
         self.ml_model = None
         self.device = torch.device("cpu")
         try:
-            model_path = os.path.join(os.path.dirname(__file__), "ml/models/best_model.pth")
-            if os.path.exists(model_path):
-                # Calculate input size: 5 base features + 2 layout features (avg_x, avg_y)
-                input_size = 7 
-                self.ml_model = InteriorFitnessModel(input_size=input_size)
-                self.ml_model.load_state_dict(torch.load(model_path, map_location=self.device))
-                self.ml_model.eval()
+            if os.path.exists(MODEL_PATH):
+                self.ml_model = _load_ml_model(MODEL_PATH, self.device)
                 print("ML Model loaded successfully for hybrid optimization.")
             else:
                 print("ML Model not found. Using pure geometric optimization.")
         except Exception as e:
             print(f"Failed to load ML model: {e}")
 
+        # Room-level ML features are fixed for the whole run, so build them once
+        # (Simplified for now, matching train.py logic)
+        self.ml_base_features = [
+            self.room_poly.area / 50.0,            # room_area
+            1.0,                                   # aspect_ratio (placeholder)
+            0.25,                                  # num_doors (placeholder)
+            0.25,                                  # num_windows (placeholder)
+            len(self.furniture_items) / 20.0,      # num_furniture
+        ]
+        self.room_width = self.max_x - self.min_x
+        self.room_height = self.max_y - self.min_y
+
     def create_individual(self):
         """Create a random layout"""
         layout = []
@@ -55,6 +84,9 @@ class GeneticOptimizer:
 
     def crossover(self, parent1, parent2):
         """Single point crossover"""
+        # A single item has no cut point; pass copies through unchanged
+        if len(self.furniture_items) < 2:
+            return parent1[:], parent2[:]
         point = random.randint(1, len(self.furniture_items) - 1)
         child1 = parent1[:point] + parent2[point:]
         child2 = parent2[:point] + parent1[point:]
@@ -74,41 +106,34 @@ class GeneticOptimizer:
                 individual[i] = (x, y, rot)
         return individual
 
-    def _get_ml_score(self, individual):
-        """Predict fitness using ML model"""
+    def _get_ml_scores(self, population):
+        """Predict fitness for a whole population in one ML forward pass"""
         if not self.ml_model:
-            return 0.0
+            return [0.0] * len(population)
             
-        # Extract features (Simplified for now, matching train.py logic)
         # In a real app, we should share feature extraction code
-        room_area = self.room_poly.area / 50.0
-        aspect_ratio = 1.0 # Placeholder
-        num_doors = 0.25 # Placeholder
-        num_windows = 0.25 # Placeholder
-        num_furniture = len(self.furniture_items) / 20.0
+        # Layout features: mean (x, y) of every layout in one reduction
+        layouts = np.asarray(population, dtype=np.float64)  # (pop, items, 3)
+        centers = layouts[:, :, :2].mean(axis=1)
         
-        # Layout features
-        xs = [item[0] for item in individual]
-        ys = [item[1] for item in individual]
-        avg_x = sum(xs) / len(xs)
-        avg_y = sum(ys) / len(ys)
-        
-        width = self.max_x - self.min_x
-        height = self.max_y - self.min_y
-        norm_avg_x = avg_x / width if width > 0 else 0
-        norm_avg_y = avg_y / height if height > 0 else 0
-        
-        features = [room_area, aspect_ratio, num_doors, num_windows, num_furniture, norm_avg_x, norm_avg_y]
-        tensor_in = torch.tensor([features], dtype=torch.float32).to(self.device)
+        features = np.empty((len(population), 7), dtype=np.float32)
+        features[:, :5] = self.ml_base_features
+        features[:, 5] = centers[:, 0] / self.room_width if self.room_width > 0 else 0
+        features[:, 6] = centers[:, 1] / self.room_height if self.room_height > 0 else 0
+        tensor_in = torch.from_numpy(features).to(self.device)
         
         with torch.no_grad():
-            score = self.ml_model(tensor_in).item()
+            scores = self.ml_model(tensor_in).squeeze(1)
             
         # Denormalize score (model output is roughly -1 to 1)
-        return score * 100.0
+        return (scores * 100.0).tolist()
 
     def optimize(self):
         """Run the genetic algorithm"""
+        # Nothing to place: an empty layout is trivially valid
+        if not self.furniture_items:
+            return [], 0.0
+            
         # Initialize population
         population = [self.create_individual() for _ in range(self.pop_size)]
         
@@ -118,11 +143,11 @@ class GeneticOptimizer:
         for gen in range(self.generations):
             # Evaluate fitness
             fitness_scores = []
-            for ind in population:
+            ml_scores = self._get_ml_scores(population)
+            for ind, ml_score in zip(population, ml_scores):
                 geo_score = self.evaluator.calculate_fitness(ind)
                 
                 if self.ml_model:
-                    ml_score = self._get_ml_score(ind)
                     # Hybrid Score: 70% Geometry (Hard Constraints), 30% ML (Heuristics)
                     final_score = (geo_score * 0.7) + (ml_score * 0.3)
                 else:
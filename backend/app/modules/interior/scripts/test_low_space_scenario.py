@@ -1,8 +1,16 @@
-import requests
-import json
+import sys
+import os
+from fastapi.testclient import TestClient
+
+# Add backend to path so the FastAPI app can be imported in-process
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../")))
+
+from app.main import app
+
+client = TestClient(app)
 
 def test_low_space_optimization():
-    url = "http://127.0.0.1:8000/api/v1/interior/optimize"
+    url = "/api/v1/interior/optimize"
     
     # 1. Define Small Room (3m x 3m)
     room_polygon = [
@@ -30,7 +38,7 @@ def test_low_space_optimization():
     print(f"Items: King Bed, Wardrobe, Desk, Chair")
     
     try:
-        response = requests.post(url, json=payload)
+        response = client.post(url, json=payload)
         
         if response.status_code == 200:
             data = response.json()
@@ -1,8 +1,16 @@
-import requests
-import json
+import sys
+import os
+from fastapi.testclient import TestClient
+
+# Add backend to path so the FastAPI app can be imported in-process
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../")))
+
+from app.main import app
+
+client = TestClient(app)
 
 def verify_api():
-    url = "http://127.0.0.1:8000/api/v1/interior/optimize"
+    url = "/api/v1/interior/optimize"
     
     payload = {
         "room_polygon": [[0,0], [5,0], [5,5], [0,5]],
@@ -15,7 +23,7 @@ def verify_api():
     
     print(f"Sending request to {url}...")
     try:
-        response = requests.post(url, json=payload)
+        response = client.post(url, json=payload)
         
         if response.status_code == 200:
             data = response.json()